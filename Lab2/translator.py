@@ -20,9 +20,58 @@ tokens into a grammatically correct French sentence, cleaning up spacing around
 punctuation. The system successfully translates the example sentences from English to French.
 """
 
+import marshal
+import os
 import re
+
+# Bump whenever parse_lexicon or the entry format changes, so old caches are ignored
+LEXICON_CACHE_VERSION = 1
+
+# Patterns compiled once at import instead of on every lexicon line
+NOUN_SECTION_RE = re.compile(r'^(\w+)\s+N\s+\((\w+)\)')
+POS_SECTION_RE = re.compile(r'^(\w+)\s+\((\w+)\)')
+PNOUN_SECTION_RE = re.compile(r'^PNOUN\b.*')
+TOKEN_RE = re.compile(r"[\w']+|[.,!?;]")
+PUNCT_RE = re.compile(r"[.,!?;]")
+PUNCT_SPACE_RE = re.compile(r"\s+([.,!?;])")
+
 # Load Lexicon
 def load_lexicon(path):
+    """
+    Load the lexicon, reusing the parsed version cached next to the source file.
+    The cache uses marshal, which is built into the interpreter and costs nothing to import.
+    The cache is rebuilt whenever lexicon.txt changes (size or modification time)
+    or LEXICON_CACHE_VERSION is bumped.
+    """
+    cache_path = os.path.splitext(path)[0] + ".cache"
+    stat = os.stat(path)
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = marshal.load(f)
+        if (cached["version"] == LEXICON_CACHE_VERSION
+                and cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == stat.st_size):
+            return cached["lexicon"]
+    except (OSError, EOFError, ValueError, KeyError, TypeError):
+        pass
+
+    lexicon = parse_lexicon(path)
+    cached = {"version": LEXICON_CACHE_VERSION, "mtime_ns": stat.st_mtime_ns,
+              "size": stat.st_size, "lexicon": lexicon}
+    # Write to a per-process temp file and swap it in, so concurrent readers never see a partial cache
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            marshal.dump(cached, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # read-only checkout, just parse again next time
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    return lexicon
+
+def parse_lexicon(path):
     lexicon = {}
     current_pos = None
     gender = None
@@ -32,17 +81,17 @@ def load_lexicon(path):
             if not line or line.startswith("English-to-French"):
                 continue
             # Extract POS and gender
-            section_match = re.match(r'^(\w+)\s+N\s+\((\w+)\)', line)
+            section_match = NOUN_SECTION_RE.match(line)
             if section_match:
                 current_pos = "N"
                 gender = section_match.group(1)
                 continue
-            section_match = re.match(r'^(\w+)\s+\((\w+)\)', line)
+            section_match = POS_SECTION_RE.match(line)
             if section_match:
                 current_pos = section_match.group(1)
                 gender = None
                 continue
-            section_match = re.match(r'^PNOUN\b.*', line)
+            section_match = PNOUN_SECTION_RE.match(line)
             if section_match:
                 current_pos = 'PNOUN'
                 gender = None
@@ -63,7 +112,7 @@ def load_lexicon(path):
 
 def translate(sentence, lexicon):
     # Tokenize sentence (keep punctuation)
-    words = re.findall(r"[\w']+|[.,!?;]", sentence)
+    words = TOKEN_RE.findall(sentence)
     words = [w.lower() for w in words]
 
     # Helper to get all POS tags for a word
@@ -144,7 +193,7 @@ def translate(sentence, lexicon):
 
     # Translate remaining words using lexicon directly
     for i, w in enumerate(output):
-        if translated[i] or re.fullmatch(r"[.,!?;]", w):
+        if translated[i] or PUNCT_RE.fullmatch(w):
             continue
         if w in lexicon:
             entry = lexicon[w][0]  # take first entry
@@ -157,7 +206,7 @@ def translate(sentence, lexicon):
 
     # Join sentence and clean punctuation spacing
     result = " ".join(output)
-    result = re.sub(r"\s+([.,!?;])", r"\1", result)
+    result = PUNCT_SPACE_RE.sub(r"\1", result)
     return result
 
 
@@ -1,12 +1,13 @@
-import asyncio
 import random
-from googletrans import Translator, LANGUAGES
 
 
 async def translation_loop(text: str, num_languages: int = 10, languages: list[str] = None):
     """
     Pass text through a sequence of translations using googletrans (async).
+    googletrans is imported here so that importing this module stays cheap.
     """
+    from googletrans import Translator, LANGUAGES
+
     async with Translator() as translator:
         sequence = []
 
@@ -57,5 +58,7 @@ async def translation_loop(text: str, num_languages: int = 10, languages: list[s
 
 
 if __name__ == "__main__":
+    import asyncio
+
     text = "Catherine decides to make an overture of goodwill by offering up Margot in marriage to prominent Huguenot and King of Navarre, Henri de Bourbon, which is supposed to cement the hard-fought Peace of Saint-Germain. At the same time, Catherine schemes to bring about the notorious St. Bartholomew's Day Massacre of 1572 and assassinate many of the most wealthy and prominent Huguenots, who are in the largely-Catholic city of Paris to escort the Protestant prince to his wedding. The massacre begins four days after the wedding ceremony, and thousands of Protestants are slaughtered. The marriage goes ahead, but Margot, who does not love Henri, begins a passionate affair with the soldier La Môle, also a Protestant from a well-to-do family."
     asyncio.run(translation_loop(text, num_languages=10,languages=['bem', 'haw', 'hmn', 'kri', 'mfe', 'mni-mtei', 'nus', 'tiv', 'yua', 'lus']))
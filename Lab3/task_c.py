@@ -63,4 +63,5 @@ def romanian_to_pisicesc(text):
     return " ".join(output_sentences)
 
 
-print(romanian_to_pisicesc("Lucrarea analizează impactul tehnologiei moderne asupra comunicării dintre oameni. Cercetătorii observă o creștere a energiei creative."))
\ No newline at end of file
+if __name__ == "__main__":
+    print(romanian_to_pisicesc("Lucrarea analizează impactul tehnologiei moderne asupra comunicării dintre oameni. Cercetătorii observă o creștere a energiei creative."))
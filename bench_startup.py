@@ -0,0 +1,161 @@
+"""
+Startup benchmark for the lab entry points.
+
+For every module it reports:
+ - the import time measured by `python -X importtime` (cumulative, in ms)
+ - the time-to-first-translation: wall time of a fresh interpreter that
+   imports the module and produces its first translation
+
+Each measurement runs in a new process, so it reflects a real cold start.
+Lab3/task_b.py needs network access for a translation, so its
+time-to-first-translation is only measured with --network.
+Lab5/main.py does not translate, only its import time is measured.
+
+For Lab2/translator.py the first translation is also reported with a cold
+lexicon cache (cache deleted before every run), a warm cache, and without the
+cache (parsing lexicon.txt directly), so a cache that costs more than it
+saves shows up as a regression against the no-cache row.
+
+Usage: python bench_startup.py [--runs N] [--network]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+LAB2_CACHE = os.path.join(ROOT, "Lab2", "lexicon.cache")
+LAB2_SENTENCE = "Mary reads a book."
+# Differences smaller than this are within run-to-run noise of a fresh interpreter
+NOISE_MS = 1.0
+
+# (label, directory, module, code producing the first translation)
+MODULES = [
+    ("Lab2/translator.py", "Lab2", "translator",
+     f"translator.translate({LAB2_SENTENCE!r}, translator.load_lexicon('lexicon.txt'))"),
+    ("Lab3/task_b.py", "Lab3", "task_b",
+     "import asyncio; asyncio.run(task_b.translation_loop('Hello world.', languages=['fr']))"),
+    ("Lab3/task_c.py", "Lab3", "task_c",
+     "task_c.romanian_to_pisicesc('Lucrarea analizează impactul tehnologiei.')"),
+    ("Lab5/main.py", "Lab5", "main", None),
+]
+
+
+def error_message(proc):
+    """Last line of the child's stderr, or its exit code when stderr is empty"""
+    lines = proc.stderr.strip().splitlines()
+    return lines[-1] if lines else f"exit code {proc.returncode}"
+
+
+def run_ms(directory, script):
+    """Wall time of a fresh interpreter running the script"""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=os.path.join(ROOT, directory), capture_output=True, text=True,
+    )
+    elapsed = (time.perf_counter() - start) * 1000
+    if proc.returncode != 0:
+        raise RuntimeError(error_message(proc))
+    return elapsed
+
+
+def import_time_ms(directory, module):
+    """Cumulative import time of the module, as reported by -X importtime"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=os.path.join(ROOT, directory), capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(error_message(proc))
+    # Lines look like: "import time:   self [us] | cumulative | imported package"
+    for line in proc.stderr.splitlines():
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000
+    raise RuntimeError(f"no importtime entry for {module}")
+
+
+def first_translation_ms(directory, module, code):
+    """Wall time of a fresh interpreter importing the module and translating once"""
+    return run_ms(directory, f"import {module}\n{code}")
+
+
+def remove_lab2_cache():
+    try:
+        os.remove(LAB2_CACHE)
+    except FileNotFoundError:
+        pass
+
+
+def cold_cache_ms(directory, module, code):
+    """First translation with the lexicon cache deleted beforehand (cache miss)"""
+    remove_lab2_cache()
+    return first_translation_ms(directory, module, code)
+
+
+def measure(func, runs, *args):
+    """Median over the runs, or None if the child process failed"""
+    try:
+        return statistics.median(func(*args) for _ in range(runs))
+    except RuntimeError as e:
+        print(f"  {args[0]}/{args[1]}: {e}", file=sys.stderr)
+        return None
+
+
+def fmt(ms):
+    return f"{'error':>10}" if ms is None else f"{ms:10.1f}"
+
+
+def lab2_cache_report(runs):
+    """First translation of Lab2 with a cold cache, a warm cache and no cache at all"""
+    load = f"translator.translate({LAB2_SENTENCE!r}, translator.load_lexicon('lexicon.txt'))"
+    parse = f"translator.translate({LAB2_SENTENCE!r}, translator.parse_lexicon('lexicon.txt'))"
+
+    cold = measure(cold_cache_ms, runs, "Lab2", "translator", load)
+    # The last cold run left a fresh cache behind, so every run below is a hit
+    warm = measure(first_translation_ms, runs, "Lab2", "translator", load)
+    no_cache = measure(first_translation_ms, runs, "Lab2", "translator", parse)
+
+    print("\nLab2 lexicon cache, first translation (ms):")
+    print(f"  {'cold cache (miss)':<28}{fmt(cold)}")
+    print(f"  {'warm cache (hit)':<28}{fmt(warm)}")
+    print(f"  {'no cache (parse_lexicon)':<28}{fmt(no_cache)}")
+    if warm is not None and no_cache is not None:
+        delta = warm - no_cache
+        if abs(delta) < NOISE_MS:
+            verdict = "no measurable difference"
+        elif delta < 0:
+            verdict = "cache helps"
+        else:
+            verdict = "REGRESSION: cache is slower than parsing"
+        print(f"  {'warm vs no cache':<28}{delta:+10.1f}  ({verdict})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="runs per measurement (median is reported)")
+    parser.add_argument("--network", action="store_true", help="also translate with googletrans (Lab3/task_b.py)")
+    args = parser.parse_args()
+
+    # Interpreter startup alone, to put the numbers below in context
+    baseline = statistics.median(run_ms("", "pass") for _ in range(args.runs))
+    print(f"Interpreter startup: {baseline:.1f} ms (median of {args.runs} runs)\n")
+
+    print(f"{'module':<22}{'import (ms)':>12}{'first translation (ms)':>26}")
+    for label, directory, module, code in MODULES:
+        imp = fmt(measure(import_time_ms, args.runs, directory, module))
+        if code is None or (module == "task_b" and not args.network):
+            first = f"{'-':>10}"
+        else:
+            first = fmt(measure(first_translation_ms, args.runs, directory, module, code))
+        print(f"{label:<22}{imp:>12}{first:>26}")
+
+    lab2_cache_report(args.runs)
+
+
+if __name__ == "__main__":
+    main()